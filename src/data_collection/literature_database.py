@@ -13,14 +13,77 @@ Key metrics tracked:
 """
 
 import os
+import re
+import copy
+import bisect
+import math
+import importlib.util
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass, asdict, field
+from collections import defaultdict
+from typing import List, Dict, Optional, Any, Callable, Set, Tuple, Union
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 import warnings
 
+try:
+    import numexpr  # noqa: F401
+    _HAS_NUMEXPR = True
+except ImportError:
+    _HAS_NUMEXPR = False
 
-@dataclass
+# numba is slow to import, so only check it is installed; it is imported on
+# first use by _jit_benchmark_kernel()
+_HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    _HAS_AHOCORASICK = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+
+# Below this many rows plain boolean indexing beats numexpr in query()
+_NUMEXPR_MIN_ROWS = 200
+
+# Below this many rows the NumPy comparisons in benchmark_against_targets()
+# beat the Numba kernel once its import and JIT load time is counted
+_NUMBA_MIN_ROWS = 100_000
+
+# Column dtypes applied when the DataFrame is built
+_DTYPES = {
+    'material': 'category',
+    'substrate': 'category',
+    'deposition_method': 'category',
+    'data_quality': 'category',
+    'year': 'Int32',
+    'success_rating': 'Int16',
+}
+
+# Integer fields and the NumPy type backing their nullable dtype
+_INT_FIELDS = {
+    name: np.dtype(dtype.lower())
+    for name, dtype in _DTYPES.items()
+    if dtype.startswith('Int')
+}
+
+# Characters that make a material query a real regex rather than a substring
+_REGEX_SPECIAL = frozenset(".^$*+?{}[]\\|()")
+
+
+def _year_sort_key(entry: "CoatingPerformanceData") -> float:
+    """Sort key placing the most recent entries first and undated ones last."""
+    return -entry.year if entry.year is not None else math.inf
+
+
+@dataclass(slots=True)
 class CoatingPerformanceData:
     """Data structure for experimental coating performance from literature."""
 
@@ -29,11 +92,15 @@ class CoatingPerformanceData:
     authors: str
     year: int
     title: str
-    journal: Optional[str] = None
 
     # Coating details
     material: str  # e.g., "Nb/Ti dual-layer", "N-doped TiO2"
     substrate: str  # e.g., "SS316L", "Ti Grade 1"
+
+    # Optional paper metadata (declared after the required fields above)
+    journal: Optional[str] = None
+
+    # Optional coating details
     thickness_nm: Optional[float] = None
     deposition_method: Optional[str] = None  # e.g., "PVD", "CVD", "thermal spray"
 
@@ -71,6 +138,105 @@ class CoatingPerformanceData:
     data_quality: Optional[str] = None  # "high", "medium", "low"
 
 
+# Field names in declaration order (slotted instances have no __dict__)
+_FIELDS = [f.name for f in fields(CoatingPerformanceData)]
+_FLOAT_FIELDS = [f.name for f in fields(CoatingPerformanceData) if f.type == Optional[float]]
+_OBJECT_FIELDS = [name for name in _FIELDS if name not in _FLOAT_FIELDS]
+
+# Initial capacity of the numeric column buffers (doubled as needed)
+_MIN_CAPACITY = 16
+
+
+def _as_float(value: Optional[float]) -> float:
+    """Convert an optional metric to float, with NaN for missing."""
+    return np.nan if value is None else float(value)
+
+
+def _as_int(name: str, value: Any) -> Optional[int]:
+    """
+    Convert an optional integer field to int, keeping None for missing.
+
+    Raises:
+        ValueError: If the value is not a whole number or does not fit the
+                   field's nullable integer dtype
+    """
+    if value is None:
+        return None
+
+    as_int = int(value)
+    if as_int != value:
+        raise ValueError(f"{name} must be a whole number, got {value!r}")
+
+    info = np.iinfo(_INT_FIELDS[name])
+    if not info.min <= as_int <= info.max:
+        raise ValueError(f"{name} must be between {info.min} and {info.max}, got {value!r}")
+
+    return as_int
+
+
+def _category_mask(series: pd.Series, matches: Callable[[str], Any]) -> np.ndarray:
+    """Evaluate matches once per category and broadcast it over the rows."""
+    categories = series.cat.categories
+    if len(categories) == 0:
+        return np.zeros(len(series), dtype=bool)
+
+    hits = np.fromiter((bool(matches(c)) for c in categories), dtype=bool, count=len(categories))
+    codes = series.cat.codes.to_numpy()
+    return np.where(codes >= 0, hits[codes], False)
+
+
+def _benchmark_kernel(
+    resistance: np.ndarray,
+    corrosion: np.ndarray,
+    duration: np.ndarray,
+    cost: np.ndarray,
+    max_resistance: float,
+    max_corrosion: float,
+    min_duration: float,
+    max_cost: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Evaluate all four targets and their conjunction in a single loop."""
+    n = resistance.shape[0]
+    meets_resistance = np.empty(n, np.bool_)
+    meets_corrosion = np.empty(n, np.bool_)
+    meets_duration = np.empty(n, np.bool_)
+    meets_cost = np.empty(n, np.bool_)
+    meets_all = np.empty(n, np.bool_)
+
+    for i in range(n):
+        a = resistance[i] <= max_resistance
+        b = corrosion[i] <= max_corrosion
+        c = duration[i] >= min_duration
+        d = cost[i] <= max_cost
+        meets_resistance[i] = a
+        meets_corrosion[i] = b
+        meets_duration[i] = c
+        meets_cost[i] = d
+        meets_all[i] = a and b and c and d
+
+    return meets_resistance, meets_corrosion, meets_duration, meets_cost, meets_all
+
+
+_jit_benchmark_kernel_cache: Optional[Callable[..., Any]] = None
+
+
+def _jit_benchmark_kernel() -> Callable[..., Any]:
+    """Import numba and compile _benchmark_kernel on first use."""
+    global _jit_benchmark_kernel_cache
+    if _jit_benchmark_kernel_cache is None:
+        from numba import njit
+        _jit_benchmark_kernel_cache = njit(cache=True)(_benchmark_kernel)
+
+    return _jit_benchmark_kernel_cache
+
+
+def _ensure_parent_dir(filepath: str) -> None:
+    """Create the parent directory of filepath, if it has one."""
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
 class LiteratureDatabase:
     """
     Database for managing experimental coating performance data from literature.
@@ -82,7 +248,42 @@ class LiteratureDatabase:
     def __init__(self):
         """Initialize an empty literature database."""
         self.entries: List[CoatingPerformanceData] = []
-        self._initialize_with_key_papers()
+        self._df_cache: Optional[pd.DataFrame] = None
+
+        # Bumped on every mutation; derived results are cached per version
+        self._version = 0
+        self._stats_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._benchmark_cache: Optional[Tuple[int, Dict[str, np.ndarray]]] = None
+
+        # Entries are kept sorted by year (most recent first).
+        # Lowercased material token -> positions in self.entries; built on
+        # demand because sorted inserts move positions, and dropped by
+        # _invalidate()
+        self._material_index: Optional[Dict[str, List[int]]] = None
+        # DOIs present, for duplicate detection
+        self._dois: Set[str] = set()
+
+        # Column store mirroring self.entries, used to build the DataFrame.
+        # Float metrics live in growable float64 buffers (NaN for missing);
+        # only the first len(self.entries) slots are meaningful.
+        self._cols: Dict[str, list] = {name: [] for name in _OBJECT_FIELDS}
+        self._numeric: Dict[str, np.ndarray] = {name: np.empty(0) for name in _FLOAT_FIELDS}
+
+        # Compiled material matchers, keyed by the query that produced them.
+        # They depend only on the query, so adding entries never stales them.
+        self._material_matcher_cache: Dict[Union[str, Tuple[str, ...]], Callable[[str], Any]] = {}
+
+    @classmethod
+    def with_seed_papers(cls) -> "LiteratureDatabase":
+        """
+        Create a database pre-populated with the key high-value papers.
+
+        Returns:
+            LiteratureDatabase containing the seed entries
+        """
+        db = cls()
+        db._initialize_with_key_papers()
+        return db
 
     def _initialize_with_key_papers(self):
         """Pre-populate database with key high-value papers."""
@@ -230,8 +431,127 @@ class LiteratureDatabase:
 
         Args:
             entry: CoatingPerformanceData object
+
+        Raises:
+            ValueError: If a metric is not numeric, or year/success_rating is
+                       not a whole number in range; the database is unchanged
+        """
+        if entry.doi in self._dois:
+            warnings.warn(f"Duplicate DOI {entry.doi!r} added to literature database")
+
+        # Convert metrics and integer fields up front so a bad value fails
+        # before any mutation (and never breaks the later dtype cast)
+        metrics = {name: _as_float(getattr(entry, name)) for name in _FLOAT_FIELDS}
+        integers = {name: _as_int(name, getattr(entry, name)) for name in _INT_FIELDS}
+
+        # Insert in sorted position so the DataFrame never needs re-sorting
+        position = bisect.bisect_right(
+            self.entries, _year_sort_key(entry), key=_year_sort_key
+        )
+        size = len(self.entries)
+        self._reserve(size + 1)
+
+        self.entries.insert(position, entry)
+        for name, column in self._cols.items():
+            column.insert(position, integers[name] if name in integers else getattr(entry, name))
+        for name, values in self._numeric.items():
+            values[position + 1:size + 1] = values[position:size]
+            values[position] = metrics[name]
+        self._dois.add(entry.doi)
+        self._invalidate()
+
+    def _reserve(self, capacity: int) -> None:
+        """Grow the numeric buffers (by doubling) to hold capacity rows."""
+        current = len(next(iter(self._numeric.values())))
+        if capacity <= current:
+            return
+
+        new_capacity = max(_MIN_CAPACITY, current * 2, capacity)
+        size = len(self.entries)
+        for name, values in self._numeric.items():
+            grown = np.empty(new_capacity)
+            grown[:size] = values[:size]
+            self._numeric[name] = grown
+
+    def _invalidate(self) -> None:
+        """Drop cached DataFrame, index and results after the entries change."""
+        self._df_cache = None
+        self._material_index = None
+        self._version += 1
+
+    def _get_material_index(self) -> Dict[str, List[int]]:
+        """Return the material token index, building it if entries changed."""
+        if self._material_index is None:
+            index = defaultdict(list)
+            for position, material in enumerate(self._cols['material']):
+                if material:
+                    for token in material.lower().split():
+                        index[token].append(position)
+            self._material_index = index
+
+        return self._material_index
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the DOI set and column store after a bulk load."""
+        self._dois = {entry.doi for entry in self.entries}
+
+        self._cols = {
+            name: [getattr(entry, name) for entry in self.entries]
+            for name in _OBJECT_FIELDS
+        }
+        self._numeric = {
+            name: np.array([_as_float(getattr(entry, name)) for entry in self.entries])
+            for name in _FLOAT_FIELDS
+        }
+
+    def _material_rows(self, material: str) -> Optional[np.ndarray]:
+        """
+        Resolve a material substring query through the token index.
+
+        Returns:
+            Sorted DataFrame row positions of matching entries, or None if the
+            query contains whitespace or regex syntax and needs a full scan.
+        """
+        needle = material.lower()
+        if any(c.isspace() or c in _REGEX_SPECIAL for c in needle):
+            return None
+
+        positions = {
+            position
+            for token, token_positions in self._get_material_index().items()
+            if needle in token
+            for position in token_positions
+        }
+        return np.array(sorted(positions), dtype=np.intp)
+
+    def _material_matcher(self, material: Union[str, Tuple[str, ...]]) -> Callable[[str], Any]:
+        """
+        Return a cached case-insensitive matcher (truthy on a hit) for a
+        material query.
+
+        A single string is treated as a regex (as str.contains would); a
+        tuple of keywords matches any of them literally, via Aho-Corasick
+        when pyahocorasick is installed.
         """
-        self.entries.append(entry)
+        matcher = self._material_matcher_cache.get(material)
+        if matcher is not None:
+            return matcher
+
+        if isinstance(material, str):
+            matcher = re.compile(material, re.IGNORECASE).search
+        elif _HAS_AHOCORASICK:
+            automaton = ahocorasick.Automaton()
+            for keyword in material:
+                automaton.add_word(keyword.lower(), keyword)
+            automaton.make_automaton()
+
+            def matcher(value: str) -> bool:
+                return next(automaton.iter(value.lower()), None) is not None
+        else:
+            matcher = re.compile("|".join(map(re.escape, material)), re.IGNORECASE).search
+
+        self._material_matcher_cache[material] = matcher
+        return matcher
 
     def add_from_dict(self, data: Dict[str, Any]) -> None:
         """
@@ -247,19 +567,42 @@ class LiteratureDatabase:
         """
         Convert database to pandas DataFrame.
 
+        The frame is built once and cached until the entries change; each
+        call returns a copy so callers are free to modify it.
+
         Returns:
             DataFrame with all entries
         """
-        if not self.entries:
-            return pd.DataFrame()
-
-        data = [asdict(entry) for entry in self.entries]
-        df = pd.DataFrame(data)
-
-        # Sort by year (most recent first)
-        df = df.sort_values('year', ascending=False).reset_index(drop=True)
-
-        return df
+        return self._get_df_view().copy()
+
+    def _get_df_view(self) -> pd.DataFrame:
+        """Return the cached DataFrame without copying (read-only use)."""
+        if self._df_cache is None:
+            if not self.entries:
+                self._df_cache = pd.DataFrame()
+            else:
+                # Numeric columns are copied out of the buffers: add_entry
+                # shifts buffer contents in place, and frames handed to
+                # callers (e.g. by benchmark_against_targets) may share
+                # memory with this one under copy-on-write
+                size = len(self.entries)
+                columns = {
+                    name: self._numeric[name][:size].copy() if name in self._numeric else self._cols[name]
+                    for name in _FIELDS
+                }
+                df = pd.DataFrame(columns, copy=False)
+
+                # Compact dtypes: low-cardinality text as categories, small
+                # integers as nullable ints
+                df = df.astype(_DTYPES)
+
+                # DOI is the natural key; index on it (unnamed, so it never
+                # clashes with the doi column) for hashed lookups
+                df = df.set_index('doi', drop=False).rename_axis(None)
+
+                self._df_cache = df
+
+        return self._df_cache
 
     def save_to_csv(self, filepath: str, verbose: bool = True) -> None:
         """
@@ -269,9 +612,33 @@ class LiteratureDatabase:
             filepath: Path to save CSV file
             verbose: Print confirmation
         """
-        df = self.to_dataframe()
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        df.to_csv(filepath, index=False)
+        df = self._get_df_view()
+        _ensure_parent_dir(filepath)
+
+        if _HAS_PYARROW:
+            # Arrow's CSV writer is several times faster than pandas' own
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), filepath)
+        else:
+            df.to_csv(filepath, index=False)
+
+        if verbose:
+            print(f"Saved {len(df)} literature entries to {filepath}")
+
+    def save_to_parquet(self, filepath: str, verbose: bool = True) -> None:
+        """
+        Save database to a Parquet file (requires pyarrow).
+
+        Parquet keeps column types and compresses well, so it is the
+        preferred format for repeated save/load cycles.
+
+        Args:
+            filepath: Path to save Parquet file
+            verbose: Print confirmation
+        """
+        df = self._get_df_view()
+        _ensure_parent_dir(filepath)
+
+        df.to_parquet(filepath, engine='pyarrow', compression='zstd', index=False)
 
         if verbose:
             print(f"Saved {len(df)} literature entries to {filepath}")
@@ -284,57 +651,129 @@ class LiteratureDatabase:
             filepath: Path to CSV file
             verbose: Print confirmation
         """
-        df = pd.read_csv(filepath)
+        # Whole-number floats may be written without a decimal point, so
+        # pin float fields rather than letting them be inferred as ints
+        df = pd.read_csv(filepath, dtype={name: 'float64' for name in _FLOAT_FIELDS})
+        self._load_dataframe(df)
 
-        # Clear existing entries
-        self.entries = []
+        if verbose:
+            print(f"Loaded {len(self.entries)} literature entries from {filepath}")
 
-        # Add entries from CSV
-        for _, row in df.iterrows():
-            # Convert row to dict, handling NaN values
-            data = row.to_dict()
-            data = {k: (None if pd.isna(v) else v) for k, v in data.items()}
+    def load_from_parquet(self, filepath: str, verbose: bool = True) -> None:
+        """
+        Load database from a Parquet file (requires pyarrow).
 
-            try:
-                self.add_from_dict(data)
-            except Exception as e:
-                warnings.warn(f"Failed to load entry: {e}")
+        Args:
+            filepath: Path to Parquet file
+            verbose: Print confirmation
+        """
+        df = pd.read_parquet(filepath, engine='pyarrow')
+        self._load_dataframe(df)
 
         if verbose:
             print(f"Loaded {len(self.entries)} literature entries from {filepath}")
 
+    def _load_dataframe(self, df: pd.DataFrame) -> None:
+        """Replace all entries with the rows of a loaded DataFrame."""
+        # Mask NaN -> None for the whole frame at once rather than per cell
+        records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+        # Replace existing entries
+        entries = []
+        failed = []
+        for index, data in enumerate(records):
+            try:
+                for name in _INT_FIELDS:
+                    if name in data:
+                        data[name] = _as_int(name, data[name])
+                entries.append(CoatingPerformanceData(**data))
+            except Exception as e:
+                failed.append((index, str(e)))
+
+        # One warning for the whole load, not one per bad row
+        if failed:
+            warnings.warn(f"Failed to load {len(failed)} entries: first={failed[0]}")
+
+        # Sort once (most recent first) rather than inserting one by one
+        entries.sort(key=_year_sort_key)
+
+        self.entries = entries
+        self._rebuild_indexes()
+        self._invalidate()
+
+        duplicates = len(self.entries) - len(self._dois)
+        if duplicates:
+            warnings.warn(f"Loaded {duplicates} entries with duplicate DOIs")
+
+    def get_by_doi(self, doi: str) -> pd.DataFrame:
+        """
+        Look up entries by DOI.
+
+        Args:
+            doi: DOI of the paper
+
+        Returns:
+            DataFrame with the matching entries (empty if the DOI is unknown)
+        """
+        df = self._get_df_view()
+
+        if doi not in df.index:
+            return df.iloc[0:0].copy()
+
+        return df.loc[[doi]].copy()
+
     def get_summary_statistics(self) -> Dict[str, Any]:
         """
         Get summary statistics of the database.
 
+        Results are cached until the entries change.
+
         Returns:
             Dictionary with summary statistics
         """
-        df = self.to_dataframe()
+        if self._stats_cache is None or self._stats_cache[0] != self._version:
+            self._stats_cache = (self._version, self._compute_summary_statistics())
+
+        return copy.deepcopy(self._stats_cache[1])
+
+    def _compute_summary_statistics(self) -> Dict[str, Any]:
+        """Compute summary statistics from the cached DataFrame."""
+        df = self._get_df_view()
 
         if df.empty:
             return {"error": "No entries in database"}
 
+        # Numeric reductions in a single pass
+        numeric = df[[
+            'test_duration_hours',
+            'corrosion_current_uA_cm2',
+            'contact_resistance_mOhm_cm2',
+            'cost_estimate_dollar_m2'
+        ]].agg(['mean', 'min', 'max'])
+
         # Calculate statistics
         stats = {
             "total_entries": len(df),
             "year_range": f"{df['year'].min()}-{df['year'].max()}",
             "materials_tested": df['material'].nunique(),
-            "avg_test_duration_hours": df['test_duration_hours'].mean(),
-            "max_test_duration_hours": df['test_duration_hours'].max(),
-            "avg_corrosion_current": df['corrosion_current_uA_cm2'].mean(),
-            "best_corrosion_current": df['corrosion_current_uA_cm2'].min(),
-            "avg_contact_resistance": df['contact_resistance_mOhm_cm2'].mean(),
-            "best_contact_resistance": df['contact_resistance_mOhm_cm2'].min(),
-            "avg_cost_estimate": df['cost_estimate_dollar_m2'].mean(),
-            "success_rating_distribution": df['success_rating'].value_counts().to_dict()
+            "avg_test_duration_hours": numeric.at['mean', 'test_duration_hours'],
+            "max_test_duration_hours": numeric.at['max', 'test_duration_hours'],
+            "avg_corrosion_current": numeric.at['mean', 'corrosion_current_uA_cm2'],
+            "best_corrosion_current": numeric.at['min', 'corrosion_current_uA_cm2'],
+            "avg_contact_resistance": numeric.at['mean', 'contact_resistance_mOhm_cm2'],
+            "best_contact_resistance": numeric.at['min', 'contact_resistance_mOhm_cm2'],
+            "avg_cost_estimate": numeric.at['mean', 'cost_estimate_dollar_m2'],
+            "success_rating_distribution": {
+                int(rating): count
+                for rating, count in df['success_rating'].value_counts().to_dict().items()
+            }
         }
 
         return stats
 
     def query(
         self,
-        material: Optional[str] = None,
+        material: Optional[Union[str, List[str]]] = None,
         substrate: Optional[str] = None,
         min_test_duration: Optional[float] = None,
         max_corrosion_current: Optional[float] = None,
@@ -345,7 +784,8 @@ class LiteratureDatabase:
         Query database with filters.
 
         Args:
-            material: Filter by material (partial match)
+            material: Filter by material (partial match), or a list of
+                     keywords matching any of them
             substrate: Filter by substrate
             min_test_duration: Minimum test duration (hours)
             max_corrosion_current: Maximum corrosion current (μA/cm²)
@@ -355,29 +795,54 @@ class LiteratureDatabase:
         Returns:
             Filtered DataFrame
         """
-        df = self.to_dataframe()
+        df = self._get_df_view()
 
         if material:
-            df = df[df['material'].str.contains(material, case=False, na=False)]
+            rows = self._material_rows(material) if isinstance(material, str) else None
+            if rows is not None:
+                df = df.iloc[rows]
+            else:
+                key = material if isinstance(material, str) else tuple(material)
+                df = df[_category_mask(df['material'], self._material_matcher(key))]
 
         if substrate:
             df = df[df['substrate'].str.contains(substrate, case=False, na=False)]
 
-        if min_test_duration is not None:
-            df = df[df['test_duration_hours'] >= min_test_duration]
-
-        if max_corrosion_current is not None:
-            df = df[df['corrosion_current_uA_cm2'] <= max_corrosion_current]
-
-        if max_contact_resistance is not None:
-            df = df[df['contact_resistance_mOhm_cm2'] <= max_contact_resistance]
-
-        if min_success_rating is not None:
-            df = df[df['success_rating'] >= min_success_rating]
-
-        return df
-
-    def benchmark_against_targets(self) -> pd.DataFrame:
+        # Numeric filters are applied together as one fused expression
+        numeric_filters = [
+            ('test_duration_hours', '>=', min_test_duration),
+            ('corrosion_current_uA_cm2', '<=', max_corrosion_current),
+            ('contact_resistance_mOhm_cm2', '<=', max_contact_resistance),
+            ('success_rating', '>=', min_success_rating),
+        ]
+        numeric_filters = [f for f in numeric_filters if f[2] is not None]
+
+        if numeric_filters:
+            # numexpr setup costs more than it saves on small frames, and it
+            # cannot evaluate nullable (extension) columns such as success_rating
+            use_numexpr = _HAS_NUMEXPR and len(df) >= _NUMEXPR_MIN_ROWS
+            mask = np.ones(len(df), dtype=bool)
+            fused = []
+            values = {}
+
+            for column, op, value in numeric_filters:
+                if use_numexpr and not pd.api.types.is_extension_array_dtype(df[column]):
+                    fused.append(f"{column} {op} @value_{len(values)}")
+                    values[f"value_{len(values)}"] = value
+                elif op == '>=':
+                    mask &= (df[column] >= value).to_numpy(dtype=bool, na_value=False)
+                else:
+                    mask &= (df[column] <= value).to_numpy(dtype=bool, na_value=False)
+
+            if fused:
+                mask &= df.eval(" and ".join(fused), engine="numexpr", local_dict=values).to_numpy()
+
+            df = df[mask]
+
+        # Never hand out the cached frame itself
+        return df.copy()
+
+    def benchmark_against_targets(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Compare all coatings against DOE/industry performance targets.
 
@@ -387,14 +852,34 @@ class LiteratureDatabase:
         - Test duration: > 2000 hours (for validation)
         - Cost: < $10/m²
 
+        The pass/fail results are cached until the entries change.
+
+        Args:
+            columns: Entry columns to include alongside the pass/fail
+                    columns. Defaults to all columns.
+
         Returns:
             DataFrame with pass/fail for each target
         """
-        df = self.to_dataframe()
+        df = self._get_df_view()
 
         if df.empty:
             return pd.DataFrame()
 
+        if self._benchmark_cache is None or self._benchmark_cache[0] != self._version:
+            self._benchmark_cache = (self._version, self._compute_benchmark())
+
+        # Project before assembling so unneeded columns are never copied
+        if columns is not None:
+            df = df[list(columns)]
+
+        # assign() returns a new frame, so the cached one is left untouched;
+        # it may share the cached frame's memory, which is never mutated
+        masks = self._benchmark_cache[1]
+        return df.assign(**{name: mask.copy() for name, mask in masks.items()})
+
+    def _compute_benchmark(self) -> Dict[str, np.ndarray]:
+        """Evaluate every entry against the performance targets."""
         # Define targets
         TARGETS = {
             'contact_resistance_target': 10.0,  # mΩ·cm²
@@ -403,21 +888,44 @@ class LiteratureDatabase:
             'cost_target': 10.0  # $/m²
         }
 
-        # Evaluate against targets
-        df['meets_resistance_target'] = df['contact_resistance_mOhm_cm2'] <= TARGETS['contact_resistance_target']
-        df['meets_corrosion_target'] = df['corrosion_current_uA_cm2'] <= TARGETS['corrosion_current_target']
-        df['meets_duration_target'] = df['test_duration_hours'] >= TARGETS['test_duration_target']
-        df['meets_cost_target'] = df['cost_estimate_dollar_m2'] <= TARGETS['cost_target']
-
-        # Overall pass (all targets met)
-        df['meets_all_targets'] = (
-            df['meets_resistance_target'] &
-            df['meets_corrosion_target'] &
-            df['meets_duration_target'] &
-            df['meets_cost_target']
-        )
-
-        return df
+        # Read the metric buffers directly, with missing values replaced by
+        # a sentinel that can never meet its target (+inf for upper limits,
+        # -inf for lower limits)
+        size = len(self.entries)
+
+        def metric(name: str, missing: float) -> np.ndarray:
+            values = self._numeric[name][:size]
+            return np.where(np.isnan(values), missing, values)
+
+        resistance = metric('contact_resistance_mOhm_cm2', np.inf)
+        corrosion = metric('corrosion_current_uA_cm2', np.inf)
+        duration = metric('test_duration_hours', -np.inf)
+        cost = metric('cost_estimate_dollar_m2', np.inf)
+
+        # Evaluate against targets on the raw arrays
+        if _HAS_NUMBA and size >= _NUMBA_MIN_ROWS:
+            meets_resistance, meets_corrosion, meets_duration, meets_cost, meets_all = _jit_benchmark_kernel()(
+                resistance, corrosion, duration, cost,
+                TARGETS['contact_resistance_target'],
+                TARGETS['corrosion_current_target'],
+                TARGETS['test_duration_target'],
+                TARGETS['cost_target'],
+            )
+        else:
+            meets_resistance = resistance <= TARGETS['contact_resistance_target']
+            meets_corrosion = corrosion <= TARGETS['corrosion_current_target']
+            meets_duration = duration >= TARGETS['test_duration_target']
+            meets_cost = cost <= TARGETS['cost_target']
+            meets_all = meets_resistance & meets_corrosion & meets_duration & meets_cost
+
+        return {
+            'meets_resistance_target': meets_resistance,
+            'meets_corrosion_target': meets_corrosion,
+            'meets_duration_target': meets_duration,
+            'meets_cost_target': meets_cost,
+            # Overall pass (all targets met)
+            'meets_all_targets': meets_all,
+        }
 
     def identify_research_gaps(self) -> Dict[str, Any]:
         """
@@ -426,7 +934,7 @@ class LiteratureDatabase:
         Returns:
             Dictionary describing research gaps and missing data
         """
-        df = self.to_dataframe()
+        df = self._get_df_view()
 
         gaps = {
             "missing_long_term_data": len(df[df['test_duration_hours'] < 10000]),
@@ -447,8 +955,11 @@ class LiteratureDatabase:
 
     def _identify_untested_classes(self) -> List[str]:
         """Identify promising material classes not yet in database."""
-        df = self.to_dataframe()
-        tested_materials = set(df['material'].str.lower())
+        df = self._get_df_view()
+
+        # Lowercase each distinct tested material once, up front
+        tested_materials = tuple(m.lower() for m in df['material'].dropna().unique())
+        tested_tokens = self._get_material_index().keys()
 
         # Define promising but potentially untested classes
         promising_classes = [
@@ -464,7 +975,13 @@ class LiteratureDatabase:
 
         untested = []
         for material in promising_classes:
-            if not any(material.lower() in tested.lower() for tested in tested_materials):
+            needle = material.lower()
+
+            # An exact token hit is a guaranteed match; otherwise fall back
+            # to the substring scan
+            if needle in tested_tokens:
+                continue
+            if not any(needle in tested for tested in tested_materials):
                 untested.append(material)
 
         return untested
@@ -482,7 +999,7 @@ def main():
     print()
 
     # Initialize database (pre-populated with key papers)
-    db = LiteratureDatabase()
+    db = LiteratureDatabase.with_seed_papers()
 
     print(f"Database initialized with {len(db.entries)} key papers\n")
 
@@ -497,10 +1014,8 @@ def main():
     # Benchmark against targets
     print("\nBENCHMARK AGAINST TARGETS:")
     print("-" * 60)
-    benchmark_df = db.benchmark_against_targets()
-    print(benchmark_df[['material', 'year', 'meets_resistance_target',
-                        'meets_corrosion_target', 'meets_duration_target',
-                        'meets_cost_target', 'meets_all_targets']])
+    benchmark_df = db.benchmark_against_targets(columns=['material', 'year'])
+    print(benchmark_df)
     print()
 
     # Identify research gaps
@@ -513,7 +1028,6 @@ def main():
 
     # Save to CSV
     output_file = "data/literature/coating_performance_database.csv"
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
     db.save_to_csv(output_file)
 
     print("\n" + "="*60)
@@ -15,26 +15,56 @@ Requirements:
 """
 
 import os
+import atexit
+import contextlib
+import gzip
+import hashlib
+import json
+import pickle
+import tempfile
+import time
 import pandas as pd
-from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from tqdm import tqdm
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional
+from dataclasses import dataclass, fields
 import warnings
 
 try:
     from mp_api.client import MPRester
+    from mp_api.client.core import MPRestError
 except ImportError:
     raise ImportError(
         "mp-api package not found. Install with: pip install mp-api"
     )
 
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+
+# Arrow-backed strings avoid one Python object per cell when pyarrow is present
+_STRING_DTYPE = 'string[pyarrow]' if _HAS_PYARROW else 'string'
 
-@dataclass
+# String columns converted to _STRING_DTYPE when the DataFrame is built
+_STRING_COLUMNS = [
+    'formula',
+    'elements',
+    'space_group',
+    'chemical_system',
+    'crystal_system',
+    'material_class'
+]
+
+
+@dataclass(slots=True, frozen=True)
 class CoatingCandidate:
     """Data structure for a coating material candidate."""
 
     material_id: str
     formula: str
-    composition: str
     formation_energy_per_atom: float
     energy_above_hull: float
     band_gap: float
@@ -48,6 +78,16 @@ class CoatingCandidate:
     chemical_system: str
     is_stable: bool
 
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "CoatingCandidate":
+        """Build a candidate from one row of collected column data."""
+        return cls(**{name: row[name] for name in _CANDIDATE_FIELDS})
+
+
+_CANDIDATE_FIELDS = [f.name for f in fields(CoatingCandidate)]
+# Fields gathered from the API; is_stable is derived from energy_above_hull
+_COLLECTED_FIELDS = [name for name in _CANDIDATE_FIELDS if name != "is_stable"]
+
 
 class MaterialsProjectCollector:
     """
@@ -56,6 +96,9 @@ class MaterialsProjectCollector:
     This class provides methods to search for and retrieve potential coating
     materials from the Materials Project database, focusing on conductive
     oxides, nitrides, and carbides suitable for PEM electrolyzer applications.
+
+    The collector keeps one Materials Project client open so repeated
+    collections reuse its connections; call close() when finished with it.
     """
 
     # Define chemical systems for each coating class
@@ -75,6 +118,54 @@ class MaterialsProjectCollector:
         "Si-C", "Hf-C", "B-C"  # Additional candidates
     ]
 
+    # Concurrent API requests; kept small to stay under MP rate limits
+    MAX_WORKERS = 8
+
+    # Retry policy for transient API errors (e.g. 504s on wide systems)
+    MAX_ATTEMPTS = 5
+    MAX_BACKOFF_SECONDS = 30
+
+    # Materials up to this far (eV/atom) beyond the stability threshold are
+    # still fetched, so near-stable entries remain available for analysis;
+    # anything further above the hull is filtered out by the server
+    HULL_FILTER_BUFFER = 0.5
+
+    # Documents per paginated response, keeping each response a safe size
+    CHUNK_SIZE = 1000
+
+    # Summary fields requested for every material: only what CoatingCandidate
+    # stores. Heavy per-material data (e.g. full compositions or structures)
+    # should be fetched in a second, targeted query for the candidates that
+    # survive screening.
+    SEARCH_FIELDS = [
+        "material_id",
+        "formula_pretty",
+        "formation_energy_per_atom",
+        "energy_above_hull",
+        "band_gap",
+        "density",
+        "symmetry",
+        "volume",
+        "elements",
+        "nelements"
+    ]
+
+    # Low-cardinality string columns stored dictionary-encoded in Parquet
+    DICTIONARY_COLUMNS = [
+        "material_class",
+        "chemical_system",
+        "crystal_system",
+        "space_group",
+        "elements"
+    ]
+
+    # Joined element strings by element tuple; only a few dozen distinct
+    # element sets occur, so each is formatted once and then reused
+    _elements_str_cache: Dict[tuple, str] = {}
+
+    # On-disk cache of processed search results, keyed by query parameters
+    CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pem_cloak", "mp")
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize the Materials Project collector.
@@ -96,7 +187,33 @@ class MaterialsProjectCollector:
                 "Get your API key at: https://materialsproject.org/api"
             )
 
-        self.candidates: List[CoatingCandidate] = []
+        # Collected data is stored column-wise, one list per CoatingCandidate field
+        self._columns: Dict[str, list] = {name: [] for name in _COLLECTED_FIELDS}
+        self._stability_threshold: Optional[float] = None
+        # DataFrame built from self._columns, cached until the next collection
+        self._df: Optional[pd.DataFrame] = None
+
+        # One long-lived client keeps its HTTP connections open across
+        # collection runs; call close() when done (also done at exit)
+        self._mpr: Optional[MPRester] = None
+        self._open_client()
+
+    def _open_client(self) -> MPRester:
+        """Return the shared MPRester client, opening it if needed."""
+        if self._mpr is None:
+            self._mpr = MPRester(self.api_key)
+            atexit.register(self.close)
+
+        return self._mpr
+
+    def close(self) -> None:
+        """Close the Materials Project client and its HTTP session."""
+        if self._mpr is None:
+            return
+
+        self._mpr.session.close()
+        self._mpr = None
+        atexit.unregister(self.close)
 
     def collect_coating_candidates(
         self,
@@ -104,23 +221,38 @@ class MaterialsProjectCollector:
         include_oxides: bool = True,
         include_nitrides: bool = True,
         include_carbides: bool = True,
+        use_cache: bool = True,
+        cache_ttl_days: int = 30,
+        stream_to: Optional[str] = None,
         verbose: bool = True
-    ) -> pd.DataFrame:
+    ) -> Optional[pd.DataFrame]:
         """
         Collect coating material candidates from Materials Project.
 
         Args:
             stability_threshold: Maximum energy above hull (eV/atom) to consider
                                a material stable. Default 0.1 eV/atom.
+                               Materials more than HULL_FILTER_BUFFER above
+                               this are not fetched.
             include_oxides: Include conductive oxide candidates
             include_nitrides: Include nitride candidates
             include_carbides: Include carbide candidates
+            use_cache: Serve repeated queries from the on-disk cache in
+                      CACHE_DIR and store new results there
+            cache_ttl_days: Re-download cached results older than this
+            stream_to: If given, write each query's rows to this CSV file as
+                      soon as it (and every query submitted before it) has
+                      completed, instead of holding them in memory. Rows are
+                      in search order, not sorted by stability.
             verbose: Print progress information
 
         Returns:
-            DataFrame containing all collected coating candidates
+            DataFrame containing all collected coating candidates, or None
+            when stream_to is given (load the file with pd.read_csv)
         """
-        self.candidates = []
+        self._columns = {name: [] for name in _COLLECTED_FIELDS}
+        self._df = None
+        self._stability_threshold = stability_threshold
 
         # Build list of chemical systems to search
         systems_to_search = []
@@ -135,97 +267,359 @@ class MaterialsProjectCollector:
             print(f"Searching {len(systems_to_search)} chemical systems...")
             print(f"Stability threshold: {stability_threshold} eV/atom above hull\n")
 
-        # Search each chemical system
-        with MPRester(self.api_key) as mpr:
-            for chemical_system, material_class in systems_to_search:
-                if verbose:
-                    print(f"Searching {chemical_system} ({material_class})...", end=" ")
-
-                try:
-                    # Query Materials Project
-                    docs = mpr.materials.summary.search(
-                        chemsys=chemical_system,
-                        fields=[
-                            "material_id",
-                            "formula_pretty",
-                            "composition",
-                            "formation_energy_per_atom",
-                            "energy_above_hull",
-                            "band_gap",
-                            "density",
-                            "symmetry",
-                            "volume",
-                            "elements",
-                            "nelements"
-                        ]
-                    )
-
-                    # Process results
-                    stable_count = 0
-                    for doc in docs:
-                        # Check stability
-                        energy_above_hull = doc.energy_above_hull
-                        is_stable = energy_above_hull <= stability_threshold
-
-                        if is_stable:
-                            stable_count += 1
-
-                        # Create candidate
-                        candidate = CoatingCandidate(
-                            material_id=doc.material_id,
-                            formula=doc.formula_pretty,
-                            composition=str(doc.composition),
-                            formation_energy_per_atom=doc.formation_energy_per_atom,
-                            energy_above_hull=energy_above_hull,
-                            band_gap=doc.band_gap,
-                            density=doc.density,
-                            crystal_system=doc.symmetry.crystal_system.value,
-                            space_group=doc.symmetry.symbol,
-                            volume=doc.volume,
-                            elements="-".join([str(e) for e in doc.elements]),
-                            nelements=doc.nelements,
-                            material_class=material_class,
-                            chemical_system=chemical_system,
-                            is_stable=is_stable
+        # Group systems by class so each class is one bulk chemsys=[...] query
+        systems_by_class: Dict[str, List[str]] = {}
+        for chemical_system, material_class in systems_to_search:
+            systems_by_class.setdefault(material_class, []).append(chemical_system)
+
+        failed_classes = set()
+        # Material IDs already written, to skip repeats across streamed batches
+        streamed_ids = set()
+        # Per-system (found, stable) counts of streamed batches
+        streamed_counts: List[pd.DataFrame] = []
+
+        if stream_to:
+            os.makedirs(os.path.dirname(stream_to) or ".", exist_ok=True)
+            stream_file = open(stream_to, "w", newline="")
+        else:
+            stream_file = contextlib.nullcontext()
+
+        # Bulk queries are network-bound, so run them concurrently on one client
+        mpr = self._open_client()
+        with stream_file:
+            if stream_to:
+                # Header through pandas too, so the file has one line ending
+                pd.DataFrame(columns=_CANDIDATE_FIELDS).to_csv(stream_file, index=False)
+
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                pending = [
+                    (executor.submit(
+                        self._fetch_systems, mpr, chemical_systems,
+                        stability_threshold, use_cache, cache_ttl_days
+                    ), material_class)
+                    for material_class, chemical_systems in systems_by_class.items()
+                ]
+                progress = tqdm(total=len(pending), desc="MP queries", disable=not verbose)
+
+                # Handle results in submission order so output is reproducible,
+                # each as soon as it resolves; popping drops the finished future
+                # so its records can be freed once processed
+                while pending:
+                    future, material_class = pending.pop(0)
+                    chemical_systems = systems_by_class[material_class]
+
+                    try:
+                        records = future.result()
+                    except Exception as e:
+                        progress.update()
+                        failed_classes.add(material_class)
+                        if verbose:
+                            tqdm.write(f"{material_class} ({len(chemical_systems)} systems): Error: {str(e)}")
+                        warnings.warn(f"Failed to retrieve {material_class} systems: {str(e)}")
+                        continue
+
+                    # MP reports chemsys with alphabetically sorted elements;
+                    # map that back to the labels used in the class lists
+                    system_of = {
+                        self._canonical_chemsys(s.split("-")): s for s in chemical_systems
+                    }
+
+                    # Process results (only this thread touches self._columns)
+                    columns = {name: [] for name in _COLLECTED_FIELDS} if stream_to else self._columns
+                    for record in records:
+                        chemical_system = system_of.get(
+                            self._canonical_chemsys(record["elements"].split("-"))
                         )
+                        if chemical_system is None:
+                            continue
+
+                        # Append candidate fields straight into the columns
+                        for name, value in record.items():
+                            columns[name].append(value)
+                        columns["material_class"].append(material_class)
+                        columns["chemical_system"].append(chemical_system)
+
+                    if stream_to:
+                        batch = self._drop_duplicate_materials(
+                            self._label_stability(pd.DataFrame(columns)), streamed_ids
+                        )
+                        batch.to_csv(stream_file, header=False, index=False)
+                        streamed_counts.append(self._count_by_system(batch))
 
-                        self.candidates.append(candidate)
-
-                    if verbose:
-                        print(f"Found {len(docs)} materials ({stable_count} stable)")
+                    del records
+                    progress.update()
 
-                except Exception as e:
-                    if verbose:
-                        print(f"Error: {str(e)}")
-                    warnings.warn(f"Failed to retrieve {chemical_system}: {str(e)}")
+                progress.close()
 
-        # Convert to DataFrame
-        df = self._to_dataframe()
+        if stream_to:
+            counts = pd.concat(streamed_counts) if streamed_counts else self._count_by_system(None)
+            df = None
+        else:
+            # Convert to DataFrame
+            df = self._to_dataframe()
+            counts = self._count_by_system(df)
 
         if verbose:
+            # Per-system counts in search order, reported once as a table
+            searched = [s for s, c in systems_to_search if c not in failed_classes]
+            print()
+            print(counts.reindex(searched, fill_value=0).rename_axis('chemical_system'))
+
+            class_of = dict(systems_to_search)
+            by_class = counts['found'].groupby(counts.index.map(class_of).rename('material_class')).sum()
+
             print(f"\n{'='*60}")
             print(f"COLLECTION COMPLETE")
             print(f"{'='*60}")
-            print(f"Total materials found: {len(df)}")
-            print(f"Stable materials (E_hull ≤ {stability_threshold} eV/atom): {df['is_stable'].sum()}")
+            print(f"Total materials found: {counts['found'].sum()}")
+            print(f"Stable materials (E_hull ≤ {stability_threshold} eV/atom): {counts['stable'].sum()}")
             print(f"\nBreakdown by class:")
-            print(df.groupby('material_class').size())
+            print(by_class.rename(None))
+            if stream_to:
+                print(f"Rows written to {stream_to}")
             print(f"{'='*60}\n")
 
+        # Callers get their own copy so edits cannot corrupt the cached frame
+        return None if df is None else df.copy()
+
+    def _fetch_systems(
+        self,
+        mpr: MPRester,
+        chemical_systems: List[str],
+        stability_threshold: float,
+        use_cache: bool,
+        cache_ttl_days: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch all materials in several chemical systems as candidate records.
+
+        Results are served from the on-disk cache when a fresh entry exists;
+        otherwise all systems go into a single paginated chemsys=[...]
+        request and the processed records are cached for the next run.
+
+        Args:
+            mpr: Open MPRester client (shared across worker threads)
+            chemical_systems: Chemical systems to search, e.g. ["Ti-N", "Cr-N"]
+            stability_threshold: Stability threshold of the collection run
+                               (sets the server-side hull filter)
+            use_cache: Read from and write to the on-disk cache
+            cache_ttl_days: Maximum age of a usable cache entry
+
+        Returns:
+            List of dicts, one per material, keyed by CoatingCandidate field
+
+        Raises:
+            MPRestError: If the request still fails after MAX_ATTEMPTS tries
+        """
+        cache_path = self._cache_path(chemical_systems, stability_threshold)
+
+        if use_cache:
+            records = self._read_cache(cache_path, cache_ttl_days)
+            if records is not None:
+                return records
+
+        docs = self._search(mpr, chemical_systems, stability_threshold)
+        records = [self._doc_to_record(doc) for doc in docs]
+
+        if use_cache:
+            self._write_cache(cache_path, records)
+
+        return records
+
+    def _search(
+        self,
+        mpr: MPRester,
+        chemical_systems: List[str],
+        stability_threshold: float
+    ) -> List[Any]:
+        """
+        Run one bulk summary search over several chemical systems.
+
+        Only materials within HULL_FILTER_BUFFER of the stability threshold
+        are requested, so clearly unstable entries never leave the server.
+        Transient API errors are retried with exponential backoff.
+
+        Args:
+            mpr: Open MPRester client (shared across worker threads)
+            chemical_systems: Chemical systems to search
+            stability_threshold: Stability threshold of the collection run
+
+        Returns:
+            List of summary documents
+
+        Raises:
+            MPRestError: If the request still fails after MAX_ATTEMPTS tries
+        """
+        for attempt in range(self.MAX_ATTEMPTS):
+            try:
+                return mpr.materials.summary.search(
+                    chemsys=chemical_systems,
+                    energy_above_hull=(0, stability_threshold + self.HULL_FILTER_BUFFER),
+                    fields=self.SEARCH_FIELDS,
+                    chunk_size=self.CHUNK_SIZE
+                )
+            except MPRestError:
+                if attempt == self.MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(min(2 ** attempt, self.MAX_BACKOFF_SECONDS))
+
+    @classmethod
+    def _doc_to_record(cls, doc: Any) -> Dict[str, Any]:
+        """Extract the CoatingCandidate fields a summary document provides."""
+        element_key = tuple(doc.elements)
+        elements = cls._elements_str_cache.get(element_key)
+        if elements is None:
+            elements = cls._elements_str_cache.setdefault(
+                element_key, "-".join([str(e) for e in element_key])
+            )
+
+        return {
+            "material_id": str(doc.material_id),
+            "formula": doc.formula_pretty,
+            "formation_energy_per_atom": doc.formation_energy_per_atom,
+            "energy_above_hull": doc.energy_above_hull,
+            "band_gap": doc.band_gap,
+            "density": doc.density,
+            "crystal_system": doc.symmetry.crystal_system.value,
+            "space_group": doc.symmetry.symbol,
+            "volume": doc.volume,
+            "elements": elements,
+            "nelements": doc.nelements,
+        }
+
+    def _cache_path(self, chemical_systems: List[str], stability_threshold: float) -> str:
+        """Return the cache file for one query, named by a hash of its parameters."""
+        key = json.dumps([
+            sorted(chemical_systems),
+            self.SEARCH_FIELDS,
+            stability_threshold,
+            self.HULL_FILTER_BUFFER
+        ])
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.CACHE_DIR, f"{digest}.pkl.gz")
+
+    @staticmethod
+    def _read_cache(path: str, ttl_days: int) -> Optional[List[Dict[str, Any]]]:
+        """Load cached records, or return None if missing, stale or unreadable."""
+        try:
+            age_seconds = time.time() - os.path.getmtime(path)
+        except OSError:
+            return None
+
+        if age_seconds > ttl_days * 86400:
+            return None
+
+        try:
+            with gzip.open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            warnings.warn(f"Ignoring unreadable cache file {path}: {str(e)}")
+            return None
+
+    @staticmethod
+    def _write_cache(path: str, records: List[Dict[str, Any]]) -> None:
+        """Write records atomically so concurrent or interrupted runs never see partial files."""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                    pickle.dump(records, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            warnings.warn(f"Could not write cache file {path}: {str(e)}")
+
+    @staticmethod
+    def _canonical_chemsys(elements: List[str]) -> str:
+        """Return the chemsys string MP uses: sorted element symbols joined by '-'."""
+        return "-".join(sorted(elements))
+
+    @property
+    def candidates(self) -> List[CoatingCandidate]:
+        """Collected candidates as CoatingCandidate objects, most stable first."""
+        df = self._to_dataframe()
+        return [CoatingCandidate.from_row(row) for row in df.to_dict('records')]
+
+    def _label_stability(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Add the is_stable column with one vectorized threshold comparison."""
+        df['is_stable'] = df['energy_above_hull'] <= self._stability_threshold
         return df
 
+    @staticmethod
+    def _drop_duplicate_materials(df: pd.DataFrame, seen: Optional[set] = None) -> pd.DataFrame:
+        """
+        Drop repeated material IDs, which overlapping chemical systems can produce.
+
+        When a material appears more than once in df, the entry from the most
+        specific query system (most elements, e.g. In-Sn-O over In-O) is kept;
+        ties go to the entry that comes first in search order.
+
+        Args:
+            df: Candidate rows, in search order
+            seen: Material IDs already kept in earlier batches; rows with these
+                 IDs are dropped (the earlier batch wins) and the set is
+                 updated with the new IDs
+
+        Returns:
+            DataFrame without duplicate material IDs
+        """
+        before = len(df)
+
+        if df['material_id'].duplicated().any():
+            # Rank rows by the specificity of the system they were queried under
+            specificity = df['chemical_system'].str.count('-')
+            ranked = specificity.sort_values(ascending=False, kind='stable').index
+            df = (
+                df.loc[ranked]
+                .drop_duplicates(subset='material_id', keep='first')
+                .sort_index()
+            )
+
+        if seen is not None:
+            df = df[~df['material_id'].isin(seen)]
+            seen.update(df['material_id'])
+
+        removed = before - len(df)
+        if removed:
+            warnings.warn(f"Removed {removed} duplicate materials (same material_id in more than one chemical system)")
+
+        return df
+
+    @staticmethod
+    def _count_by_system(df: Optional[pd.DataFrame]) -> pd.DataFrame:
+        """Count found and stable materials per chemical system in one groupby pass."""
+        if df is None or df.empty:
+            return pd.DataFrame({'found': [], 'stable': []}, dtype='int64')
+
+        counts = df.groupby('chemical_system')['is_stable'].agg(['size', 'sum'])
+        return counts.rename(columns={'size': 'found', 'sum': 'stable'}).astype('int64')
+
     def _to_dataframe(self) -> pd.DataFrame:
-        """Convert collected candidates to a pandas DataFrame."""
-        if not self.candidates:
+        """
+        Convert collected candidates to a pandas DataFrame.
+
+        The frame is built once per collection and cached on self._df; the
+        cached frame is shared, so internal callers must not modify it.
+        """
+        if self._df is not None:
+            return self._df
+
+        if not self._columns["material_id"]:
             return pd.DataFrame()
 
-        data = [asdict(candidate) for candidate in self.candidates]
-        df = pd.DataFrame(data)
+        df = pd.DataFrame(self._columns).astype({name: _STRING_DTYPE for name in _STRING_COLUMNS})
+        df = self._drop_duplicate_materials(self._label_stability(df))
 
-        # Sort by energy above hull (most stable first)
-        df = df.sort_values('energy_above_hull').reset_index(drop=True)
+        # Sort by energy above hull (most stable first); ties are common (every
+        # ground state is at 0), so break them by material ID for a stable order
+        self._df = df.sort_values(
+            ['energy_above_hull', 'material_id'], kind='stable'
+        ).reset_index(drop=True)
 
-        return df
+        return self._df
 
     def save_to_csv(
         self,
@@ -251,6 +645,42 @@ class MaterialsProjectCollector:
         if verbose:
             print(f"Saved {len(df)} materials to {filepath}")
 
+    def save_to_parquet(
+        self,
+        filepath: str,
+        stable_only: bool = False,
+        verbose: bool = True
+    ) -> None:
+        """
+        Save collected candidates to a Parquet file (requires pyarrow).
+
+        Repeated string columns are stored dictionary-encoded and the file is
+        ZSTD-compressed, so it is much smaller and faster to reload than CSV.
+
+        Args:
+            filepath: Path to save Parquet file
+            stable_only: If True, only save stable materials
+            verbose: Print save confirmation
+        """
+        df = self._to_dataframe()
+
+        if stable_only:
+            df = df[df['is_stable']]
+
+        # Categoricals round-trip through pandas as dictionary arrays
+        dictionary_columns = [name for name in self.DICTIONARY_COLUMNS if name in df]
+        df = df.astype({name: 'category' for name in dictionary_columns})
+        df.to_parquet(
+            filepath,
+            engine='pyarrow',
+            compression='zstd',
+            index=False,
+            use_dictionary=dictionary_columns
+        )
+
+        if verbose:
+            print(f"Saved {len(df)} materials to {filepath}")
+
     def get_summary_statistics(self) -> Dict:
         """
         Get summary statistics of collected materials.
@@ -263,17 +693,26 @@ class MaterialsProjectCollector:
         if df.empty:
             return {"error": "No materials collected yet"}
 
+        # All column reductions in a single agg pass
+        agg = df.agg({
+            'formation_energy_per_atom': 'mean',
+            'band_gap': 'mean',
+            'density': 'mean',
+            'energy_above_hull': ['min', 'max', 'mean'],
+            'is_stable': 'sum'
+        })
+
         stats = {
             "total_materials": len(df),
-            "stable_materials": df['is_stable'].sum(),
-            "by_class": df.groupby('material_class').size().to_dict(),
-            "avg_formation_energy": df['formation_energy_per_atom'].mean(),
-            "avg_band_gap": df['band_gap'].mean(),
-            "avg_density": df['density'].mean(),
+            "stable_materials": int(agg.at['sum', 'is_stable']),
+            "by_class": df['material_class'].value_counts().sort_index().to_dict(),
+            "avg_formation_energy": agg.at['mean', 'formation_energy_per_atom'],
+            "avg_band_gap": agg.at['mean', 'band_gap'],
+            "avg_density": agg.at['mean', 'density'],
             "stability_range": {
-                "min": df['energy_above_hull'].min(),
-                "max": df['energy_above_hull'].max(),
-                "mean": df['energy_above_hull'].mean()
+                "min": agg.at['min', 'energy_above_hull'],
+                "max": agg.at['max', 'energy_above_hull'],
+                "mean": agg.at['mean', 'energy_above_hull']
             }
         }
 
@@ -318,19 +757,22 @@ def main():
     for key, value in stats.items():
         print(f"{key}: {value}")
 
-    # Save to CSV
-    output_file = "data/materials_project/coating_candidates.csv"
+    # Save to Parquet, with CSV as a secondary export
+    output_file = "data/materials_project/coating_candidates.parquet"
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    collector.save_to_csv(output_file, stable_only=False, verbose=True)
+    collector.save_to_parquet(output_file, stable_only=False, verbose=True)
+    collector.save_to_csv(output_file.replace(".parquet", ".csv"), stable_only=False, verbose=True)
 
     # Also save stable-only version
-    stable_file = "data/materials_project/coating_candidates_stable.csv"
-    collector.save_to_csv(stable_file, stable_only=True, verbose=True)
+    stable_file = "data/materials_project/coating_candidates_stable.parquet"
+    collector.save_to_parquet(stable_file, stable_only=True, verbose=True)
+    collector.save_to_csv(stable_file.replace(".parquet", ".csv"), stable_only=True, verbose=True)
+    collector.close()
 
     print("\n" + "="*60)
     print("NEXT STEPS:")
     print("="*60)
-    print("1. Review the collected materials in the CSV files")
+    print("1. Review the collected materials in the Parquet/CSV files")
     print("2. Open notebooks/01_data_collection.ipynb for analysis")
     print("3. Add experimental data to the literature database")
     print("4. Begin property correlation analysis")